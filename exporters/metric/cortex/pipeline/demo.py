@@ -0,0 +1,55 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Generates demo.csv, a stream of counter (ictr), value recorder (ivrec),
+and up-down counter (iudctr) instrument updates for the Cortex pipeline
+demo."""
+
+import numpy as np
+
+num_iterations = 30000
+flush_interval = 4096
+
+# Constant per-instrument line suffixes, hoisted so the loop does not
+# rebuild the same literal 30000 times.
+ictr_suffix = ',"name1, descr1, key1, value1"\n'
+ivrec_suffix = ',"name2, descr2, key2, value2"\n'
+iudctr_suffix = ',"name3, descr3, key3, value3"\n'
+
+# Compute all instrument values up front with vectorized numpy ops; the
+# remaining Python loop only formats lines. Generator.integers supports
+# the elementwise bounds of the up-down counter.
+i_arr = np.arange(num_iterations, dtype=np.int64)
+ictr = 2 * i_arr
+ivrec = np.where(i_arr % 10 == 0, 50 * i_arr, 0)
+rand = np.random.default_rng().integers(-50 * i_arr, 50 * i_arr + 1)
+
+# Binary mode with a large buffer skips per-write text encoding and
+# newline translation and flushes in 1 MiB chunks.
+with open("demo.csv", "wb", buffering=1048576) as f:
+    buf = []
+    for ictr_val, ivrec_val, randval in zip(
+        ictr.tolist(), ivrec.tolist(), rand.tolist()
+    ):
+        # One appended chunk per iteration instead of three separate
+        # f.write calls keeps the loop out of buffered I/O entirely.
+        buf.append(
+            "ictr," + str(ictr_val) + ictr_suffix
+            + "ivrec," + str(ivrec_val) + ivrec_suffix
+            + "iudctr," + str(randval) + iudctr_suffix
+        )
+        if len(buf) >= flush_interval:
+            f.write("".join(buf).encode("ascii"))
+            buf = []
+    f.write("".join(buf).encode("ascii"))
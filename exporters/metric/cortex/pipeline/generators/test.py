@@ -0,0 +1,189 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Generates a data file of randomized instrument update records and a
+matching results file with the expected answer for each aggregation, used
+to verify the Cortex pipeline end to end."""
+
+import sys
+
+import numpy as np
+
+num_records = 2000
+num_values = 8
+value_lower_limit = -50
+value_upper_limit = 50
+quantiles = [0.25, 0.5, 0.75]
+histogram_boundaries = [-25, 0, 25]
+aggregations = ["sum", "lval", "mmsc", "dist", "hist"]
+
+data_file = "data.txt"
+results_file = "results.txt"
+
+rng = np.random.default_rng()
+
+
+def record_index(record):
+    """Returns the generation index embedded in a record's metric name."""
+    return int(record[6 : record.index("_")])
+
+
+def sort_data_file(path):
+    """Re-sorts a data file into record order. The generator now emits
+    records already ordered; this is kept for data files produced by older
+    versions of this script."""
+    with open(path) as f:
+        records = f.readlines()
+    # Parse each record index once into an int64 array and reorder with
+    # numpy's stable C sort rather than the Python key/compare path.
+    idxs = np.fromiter(
+        (record_index(r) for r in records), dtype=np.int64, count=len(records)
+    )
+    order = np.argsort(idxs, kind="stable")
+    with open(path, "w") as f:
+        f.writelines(records[j] for j in order.tolist())
+
+
+# output_records holds each data-file record at its generation index, so
+# the data file is written once, already in replay order. Answers are
+# kept as structure-of-arrays: one (num_records, 11) int64 matrix per
+# aggregation type plus an agg_properties -> row-index map, rather than a
+# nested defaultdict of per-record Python lists. Each answer row is laid
+# out as:
+#   [0]    sum (last value for lval)
+#   [1]    min        [2] max        [3] count
+#   [4:7]  cumulative histogram bucket counts    [7] total count
+#   [8:11] quantile values
+output_records = [None] * num_records
+row_idx = {agg: {} for agg in aggregations}
+rows = {agg: np.zeros((num_records, 11), dtype=np.int64) for agg in aggregations}
+
+
+def answer_row(agg_type, agg_properties):
+    """Returns the answer row for agg_properties, appending one on first
+    sighting."""
+    idx = row_idx[agg_type].setdefault(agg_properties, len(row_idx[agg_type]))
+    return rows[agg_type][idx]
+
+
+boundaries_arr = np.asarray(histogram_boundaries, dtype=np.int64)
+
+# All record values as a single (num_records, num_values) matrix: each row
+# shuffles the full value range and keeps the first num_values entries,
+# preserving the without-replacement sampling of the per-record path.
+V = rng.permuted(
+    np.tile(np.arange(value_lower_limit, value_upper_limit), (num_records, 1)),
+    axis=1,
+)[:, :num_values]
+agg_types = [
+    aggregations[j]
+    for j in rng.integers(0, len(aggregations), num_records).tolist()
+]
+
+# All per-record statistics in a handful of whole-matrix reductions along
+# axis 1 instead of one numeric pass per record.
+sums = V.sum(axis=1)
+mins = V.min(axis=1)
+maxes = V.max(axis=1)
+lvals = V[:, -1]
+# bucket_counts[i][k] is the number of row-i values below boundary k.
+bucket_counts = (V[:, :, np.newaxis] < boundaries_arr).sum(axis=1)
+percentile_values = (
+    np.percentile(V, np.multiply(quantiles, 100), axis=1).astype(np.int64).T
+)
+
+# The remaining loop only formats records and dispatches the precomputed
+# statistics into answer rows.
+for i in range(num_records):
+    agg_type = agg_types[i]
+    name = f"p2name{i}_{agg_type}"
+    description = f"descr{i}"
+    label = f"key{i}:value{i}"
+    # Interned so the row_idx lookups hash the key once and compare by
+    # identity on later sightings.
+    agg_properties = sys.intern(f"{name},{description},{label}")
+    # Join the values directly rather than str(list) followed by a
+    # full-string space-stripping pass.
+    values_csv = "[" + ",".join(map(str, V[i].tolist())) + "]"
+    output_records[i] = f"{agg_properties}|{agg_type}|{values_csv}\n"
+
+    row = answer_row(agg_type, agg_properties)
+    if agg_type == "sum":
+        row[0] = sums[i]
+    elif agg_type == "lval":
+        row[0] = lvals[i]
+    elif agg_type == "mmsc":
+        row[0] = sums[i]
+        row[1] = mins[i]
+        row[2] = maxes[i]
+        row[3] = num_values
+    elif agg_type == "dist":
+        row[0] = sums[i]
+        row[1] = mins[i]
+        row[2] = maxes[i]
+        row[3] = num_values
+        row[8:11] = percentile_values[i]
+    elif agg_type == "hist":
+        row[0] = sums[i]
+        row[3] = num_values
+        row[4:7] = bucket_counts[i]
+        row[7] = num_values
+
+# Records were produced at known generation indices, so the data file is
+# written once, already in replay order, with no read-back/sort/rewrite.
+# Binary mode with a large buffer skips per-write text encoding and
+# newline translation.
+with open(data_file, "wb", buffering=1048576) as f:
+    f.write("".join(r for r in output_records if r is not None).encode("ascii"))
+
+# Pre-bound per-aggregation record templates; a dict lookup replaces the
+# five-way if/elif chain and each format spec is parsed once per record
+# through the cached bound method. Templates ignore the kwargs they do
+# not name, so every record can pass the full answer row.
+record_templates = {
+    "sum": "{p}|sum|{v}".format,
+    "lval": "{p}|lval|{v}".format,
+    "mmsc": "{p}|mmsc|{v}|{mn}|{mx}|{c}".format,
+    "dist": "{p}|dist|{v}|{mn}|{mx}|{c}|{{{q0},{q1},{q2}}}".format,
+    "hist": "{p}|hist|{v}|{c}|{{{b0},{b1},{b2},{b3}}}".format,
+}
+
+# Accumulate result records and write the file in one shot, same as the
+# data file above.
+records = []
+for agg_type in aggregations:
+    template = record_templates[agg_type]
+    for agg_properties, idx in row_idx[agg_type].items():
+        a = rows[agg_type][idx]
+        mn = a[1]
+        mx = a[2]
+        records.append(
+            template(
+                p=agg_properties,
+                v=a[0],
+                mn=mn,
+                mx=mx,
+                c=a[3],
+                q0=a[8],
+                q1=a[9],
+                q2=a[10],
+                b0=a[4],
+                b1=a[5],
+                b2=a[6],
+                b3=a[7],
+            )
+        )
+
+with open(results_file, "wb", buffering=1048576) as f:
+    f.write(("\n".join(records) + "\n").encode("ascii"))